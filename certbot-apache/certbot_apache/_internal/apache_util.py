@@ -1,13 +1,15 @@
 """ Utility functions for certbot-apache plugin """
-import binascii
 import fnmatch
+import functools
 import logging
 import re
 import subprocess
 from typing import Dict
+from typing import FrozenSet
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Pattern
 from typing import Tuple
 
 import pkg_resources
@@ -18,6 +20,20 @@ from certbot.compat import os
 
 logger = logging.getLogger(__name__)
 
+# Regular expressions used to parse the output of the httpd runtime
+# configuration dumps, compiled once at import time. The Include and module
+# patterns are anchored to the start of the line and avoid leading greedy
+# wildcards so that matching each line does not need to backtrack.
+_DEFINE_RE = re.compile(r"Define: ([^ \n]*)")
+_INCLUDE_RE = re.compile(r"^[ \t]*\([^)\n]*\)[ \t]+(\S.*)$", re.MULTILINE)
+_MODULE_RE = re.compile(r"^[ \t]*(\S+)_module\b", re.MULTILINE)
+# Matches a Define passed as a -D command line option, with or without
+# whitespace between -D and the name of the variable
+_DEFINE_OPT_RE = re.compile(r"(?<!\S)-D\s*([^\s=]+)(?:=(\S*))?")
+
+# Characters with a special meaning in fnmatch patterns
+_FNMATCH_CHARS = frozenset("*?[")
+
 
 def get_mod_deps(mod_name: str) -> List[str]:
     """Get known module dependencies.
@@ -81,14 +97,22 @@ def _split_aug_path(vhost_path: str) -> Tuple[str, str]:
     """
     # Strip off /files
     file_path = vhost_path[6:]
-    internal_path: List[str] = []
+    if os.path.exists(file_path):
+        return file_path, ""
 
-    # Remove components from the end of file_path until it becomes valid
-    while not os.path.exists(file_path):
-        file_path, _, internal_path_part = file_path.rpartition("/")
-        internal_path.append(internal_path_part)
+    # Every prefix of the file path exists and no longer prefix does, so
+    # binary search for the longest existing prefix instead of checking
+    # each component from the end of the path
+    parts = file_path.split("/")
+    low, high = 1, len(parts) - 1
+    while low < high:
+        mid = (low + high + 1) // 2
+        if os.path.exists("/".join(parts[:mid])):
+            low = mid
+        else:
+            high = mid - 1
 
-    return file_path, "/".join(reversed(internal_path))
+    return "/".join(parts[:low]), "/".join(parts[low:])
 
 
 def parse_define_file(filepath: str, varname: str) -> Dict[str, str]:
@@ -101,24 +125,15 @@ def parse_define_file(filepath: str, varname: str) -> Dict[str, str]:
     :rtype: `dict`
 
     """
-    return_vars: Dict[str, str] = {}
-    # Get list of words in the variable
-    a_opts = util.get_var_from_file(varname, filepath).split()
-    for i, v in enumerate(a_opts):
-        # Handle Define statements and make sure it has an argument
-        if v == "-D" and len(a_opts) >= i+2:
-            var_parts = a_opts[i+1].partition("=")
-            return_vars[var_parts[0]] = var_parts[2]
-        elif len(v) > 2 and v.startswith("-D"):
-            # Found var with no whitespace separator
-            var_parts = v[2:].partition("=")
-            return_vars[var_parts[0]] = var_parts[2]
-    return return_vars
+    # Handles both "-D NAME[=VALUE]" and "-DNAME[=VALUE]" in a single pass
+    opts = util.get_var_from_file(varname, filepath)
+    return {match.group(1): match.group(2) or ""
+            for match in _DEFINE_OPT_RE.finditer(opts)}
 
 
 def unique_id() -> str:
     """ Returns an unique id to be used as a VirtualHost identifier"""
-    return binascii.hexlify(os.urandom(16)).decode("utf-8")
+    return os.urandom(16).hex()
 
 
 def included_in_paths(filepath: str, paths: Iterable[str]) -> bool:
@@ -133,7 +148,31 @@ def included_in_paths(filepath: str, paths: Iterable[str]) -> bool:
     :returns: True if included
     :rtype: bool
     """
-    return any(fnmatch.fnmatch(filepath, path) for path in paths)
+    exact_paths, wildcard_re = _compile_paths(tuple(paths))
+    if filepath in exact_paths:
+        return True
+    return wildcard_re is not None and wildcard_re.match(filepath) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_paths(paths: Tuple[str, ...]) -> Tuple[FrozenSet[str], Optional[Pattern]]:
+    """
+    Splits a list of paths into full paths, which can be compared
+    directly, and wildcard paths, which are compiled into a single
+    regular expression matching any of them the way
+    `fnmatch.fnmatchcase` would.
+
+    :param tuple paths: Paths to compile
+
+    :returns: Full paths and the compiled wildcard paths, if any
+    :rtype: `tuple` of `frozenset` and `re.Pattern` or `None`
+    """
+    exact_paths = frozenset(path for path in paths if not _FNMATCH_CHARS.intersection(path))
+    wildcard_paths = [path for path in paths if path not in exact_paths]
+    if not wildcard_paths:
+        return exact_paths, None
+    return exact_paths, re.compile("|".join(
+        "(?:{0})".format(fnmatch.translate(path)) for path in wildcard_paths))
 
 
 def parse_defines(define_cmd: List[str]) -> Dict[str, str]:
@@ -147,12 +186,35 @@ def parse_defines(define_cmd: List[str]) -> Dict[str, str]:
     :rtype: dict
     """
 
+    return _parse_defines_output(_get_runtime_cfg(define_cmd))
+
+
+def _parse_defines_output(stdout: str, extra_dumps: Iterable[str] = ()) -> Dict[str, str]:
+    """
+    Parses the Defines dumped by httpd.
+
+    :param str stdout: Output of the httpd command dumping defines
+    :param extra_dumps: Names of the other dumps requested from the same
+        httpd process, whose Defines are ignored
+    :type extra_dumps: `list` of `str`
+
+    :returns: dictionary of defined variables
+    :rtype: dict
+    """
     variables: Dict[str, str] = {}
-    matches = parse_from_subprocess(define_cmd, r"Define: ([^ \n]*)")
+    # Avoid running the regexp over output that can't contain the Define
+    # used to request the dump
+    if "DUMP_RUN_CFG" not in stdout:
+        return {}
+
+    matches = [match.group(1) for match in _DEFINE_RE.finditer(stdout)]
     try:
         matches.remove("DUMP_RUN_CFG")
     except ValueError:
         return {}
+    for dump in extra_dumps:
+        if dump in matches:
+            matches.remove(dump)
 
     for match in matches:
         # Value could also contain = so split only once
@@ -174,7 +236,7 @@ def parse_includes(inc_cmd: List[str]) -> List[str]:
     :rtype: list of str
     """
 
-    return parse_from_subprocess(inc_cmd, r"\(.*\) (.*)")
+    return parse_from_subprocess(inc_cmd, _INCLUDE_RE)
 
 
 def parse_modules(mod_cmd: List[str]) -> List[str]:
@@ -188,21 +250,51 @@ def parse_modules(mod_cmd: List[str]) -> List[str]:
     :rtype: list of str
     """
 
-    return parse_from_subprocess(mod_cmd, r"(.*)_module")
+    return parse_from_subprocess(mod_cmd, _MODULE_RE)
+
+
+def parse_runtime_cfg(define_cmd: List[str], inc_cmd: List[str],
+                      mod_cmd: List[str]) -> Tuple[Dict[str, str], List[str], List[str]]:
+    """
+    Gets Defines, Include directives and loaded modules from httpd.
+
+    If the commands only differ by the dump they request, as is the case
+    for the default commands, a single httpd process is run to dump all
+    of them at once instead of running one process per dump.
+
+    :param list define_cmd: httpd command to dump defines
+    :param list inc_cmd: httpd command to dump includes
+    :param list mod_cmd: httpd command to dump loaded modules
+
+    :returns: dictionary of defined variables, list of found Include
+        directive values and list of found LoadModule module names
+    :rtype: `tuple` of `dict`, `list` of `str` and `list` of `str`
+    """
+    dumps = [cmd[-1] for cmd in (define_cmd, inc_cmd, mod_cmd)]
+    if (dumps != ["DUMP_RUN_CFG", "DUMP_INCLUDES", "DUMP_MODULES"] or
+            not define_cmd[:-1] == inc_cmd[:-1] == mod_cmd[:-1] or
+            define_cmd[-2:-1] != ["-D"]):
+        return parse_defines(define_cmd), parse_includes(inc_cmd), parse_modules(mod_cmd)
+
+    stdout = _get_runtime_cfg(define_cmd + ["-D", "DUMP_INCLUDES", "-D", "DUMP_MODULES"])
+    return (_parse_defines_output(stdout, ["DUMP_INCLUDES", "DUMP_MODULES"]),
+            [match.group(1) for match in _INCLUDE_RE.finditer(stdout)],
+            [match.group(1) for match in _MODULE_RE.finditer(stdout)])
 
 
-def parse_from_subprocess(command: List[str], regexp: str) -> List[str]:
+def parse_from_subprocess(command: List[str], regexp: Pattern) -> List[str]:
     """Get values from stdout of subprocess command
 
     :param list command: Command to run
-    :param str regexp: Regexp for parsing
+    :param regexp: Compiled regexp for parsing, its first group is returned
+    :type regexp: `re.Pattern`
 
     :returns: list parsed from command output
     :rtype: list
 
     """
     stdout = _get_runtime_cfg(command)
-    return re.compile(regexp).findall(stdout)
+    return [match.group(1) for match in regexp.finditer(stdout)]
 
 
 def _get_runtime_cfg(command: List[str]) -> str:
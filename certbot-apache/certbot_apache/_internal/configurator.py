@@ -486,10 +486,13 @@ class ApacheConfigurator(common.Configurator):
         """Initializes the ParserNode parser root instance."""
 
         if HAS_APACHECONFIG:
+            defines, includes, modules = apache_util.parse_runtime_cfg(
+                self.options.get_defines_cmd, self.options.get_includes_cmd,
+                self.options.get_modules_cmd)
             apache_vars = {
-                "defines": apache_util.parse_defines(self.options.get_defines_cmd),
-                "includes": apache_util.parse_includes(self.options.get_includes_cmd),
-                "modules": apache_util.parse_modules(self.options.get_modules_cmd),
+                "defines": defines,
+                "includes": includes,
+                "modules": modules,
             }
             metadata["apache_vars"] = apache_vars
 
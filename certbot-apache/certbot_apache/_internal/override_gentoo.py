@@ -56,6 +56,6 @@ class GentooParser(parser.ApacheParser):
     def update_modules(self) -> None:
         """Get loaded modules from httpd process, and add them to DOM"""
         mod_cmd = [self.configurator.options.ctl, "modules"]
-        matches = apache_util.parse_from_subprocess(mod_cmd, r"(.*)_module")
+        matches = apache_util.parse_modules(mod_cmd)
         for mod in matches:
             self.add_mod(mod.strip())
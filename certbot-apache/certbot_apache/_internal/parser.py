@@ -290,23 +290,23 @@ class ApacheParser:
     def update_runtime_variables(self) -> None:
         """Update Includes, Defines and Includes from httpd config dump data"""
 
-        self.update_defines()
-        self.update_includes()
-        self.update_modules()
+        options = self.configurator.options
+        self.variables, includes, modules = apache_util.parse_runtime_cfg(
+            options.get_defines_cmd, options.get_includes_cmd, options.get_modules_cmd)
+        self._add_includes(includes)
+        self._add_modules(modules)
 
-    def update_defines(self) -> None:
-        """Updates the dictionary of known variables in the configuration"""
-        self.variables = apache_util.parse_defines(self.configurator.options.get_defines_cmd)
+    def _add_includes(self, matches: List[str]) -> None:
+        """Add includes found by httpd to DOM if needed
 
-    def update_includes(self) -> None:
-        """Get includes from httpd process, and add them to DOM if needed"""
+        :param list matches: Include directive values found by httpd
 
+        """
         # Find_dir iterates over configuration for Include and IncludeOptional
         # directives to make sure we see the full include tree present in the
         # configuration files
         _ = self.find_dir("Include")
 
-        matches = apache_util.parse_includes(self.configurator.options.get_includes_cmd)
         if matches:
             for i in matches:
                 if not self.parsed_in_current(i):
@@ -314,8 +314,15 @@ class ApacheParser:
 
     def update_modules(self) -> None:
         """Get loaded modules from httpd process, and add them to DOM"""
+        self._add_modules(
+            apache_util.parse_modules(self.configurator.options.get_modules_cmd))
+
+    def _add_modules(self, matches: List[str]) -> None:
+        """Add modules loaded by httpd to DOM
 
-        matches = apache_util.parse_modules(self.configurator.options.get_modules_cmd)
+        :param list matches: LoadModule module names found by httpd
+
+        """
         for mod in matches:
             self.add_mod(mod.strip())
 
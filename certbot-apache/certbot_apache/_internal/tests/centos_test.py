@@ -168,10 +168,9 @@ class MultipleVhostsTestCentOS(util.ApacheTest):
         )
         def mock_get_cfg(command):
             """Mock httpd process stdout"""
-            if command == ['httpd', '-t', '-D', 'DUMP_RUN_CFG']:
-                return define_val
-            elif command == ['httpd', '-t', '-D', 'DUMP_MODULES']:
-                return mod_val
+            if command == ['httpd', '-t', '-D', 'DUMP_RUN_CFG',
+                           '-D', 'DUMP_INCLUDES', '-D', 'DUMP_MODULES']:
+                return define_val + mod_val
             return ""
         mock_get.side_effect = mock_get_cfg
         self.config.parser.modules = {}
@@ -182,7 +181,7 @@ class MultipleVhostsTestCentOS(util.ApacheTest):
             mock_osi.return_value = ("centos", "9")
             self.config.parser.update_runtime_variables()
 
-        assert mock_get.call_count == 3
+        assert mock_get.call_count == 1
         assert len(self.config.parser.modules) == 4
         assert len(self.config.parser.variables) == 2
         assert "TEST2" in self.config.parser.variables
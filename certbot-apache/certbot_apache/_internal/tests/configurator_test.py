@@ -1,6 +1,7 @@
 # pylint: disable=too-many-lines
 """Test for certbot_apache._internal.configurator."""
 import copy
+import fnmatch
 import shutil
 import socket
 import sys
@@ -189,6 +190,96 @@ class MultipleVhostsTest(util.ApacheTest):
         for i, internal_path in enumerate(internal_paths):
             assert get_internal_aug_path(self.vh_truth[i].path) == internal_path
 
+    def test_split_aug_path(self):
+        # pylint: disable=protected-access
+        split_dir = os.path.join(self.temp_dir, "split")
+        sites_dir = os.path.join(split_dir, "sites")
+        filesystem.makedirs(sites_dir)
+        conf_file = os.path.join(sites_dir, "f.conf")
+        with open(conf_file, "w"):
+            pass
+
+        internal_path = "IfModule/VirtualHost[1]/Directory[2]"
+        assert apache_util._split_aug_path("/files" + conf_file + "/" + internal_path) == \
+            (conf_file, internal_path)
+        assert apache_util._split_aug_path("/files" + conf_file) == (conf_file, "")
+        assert apache_util._split_aug_path("/files" + conf_file + "/") == (conf_file, "")
+        assert apache_util._split_aug_path("/files" + sites_dir + "/") == (sites_dir + "/", "")
+        # Parent directory of the file doesn't exist
+        missing_path = os.path.join(split_dir, "missing", "f.conf", "VirtualHost")
+        assert apache_util._split_aug_path("/files" + missing_path) == \
+            (split_dir, "missing/f.conf/VirtualHost")
+        # No prefix of the path exists
+        assert apache_util._split_aug_path("/files") == ("", "")
+
+    def test_parse_define_file(self):
+        define_file = os.path.join(self.temp_dir, "define_file")
+
+        def parse(options):
+            with open(define_file, "w") as f:
+                f.write('OPTIONS="{0}"\n'.format(options))
+            return apache_util.parse_define_file(define_file, "OPTIONS")
+
+        assert parse("-D NAME -DNOSEP=VAL -D ASSIGN=a=b x-Dy -D") == \
+            {"NAME": "", "NOSEP": "VAL", "ASSIGN": "a=b"}
+        assert parse("-k start -DFOREGROUND") == {"FOREGROUND": ""}
+        assert parse("") == {}
+        # The name following a separate -D is never parsed as another option
+        assert parse("-D -DFOO") == {"-DFOO": ""}
+        # Defines without a name are ignored
+        assert parse("-D=x -D =x") == {}
+
+    def test_included_in_paths_wildcards(self):
+        paths = [
+            "/etc/apache2/mods-enabled/*.load",
+            "/etc/apache2/sites-[ae]*/00?-default.conf",
+            "/etc/apache2/*/ports.conf",
+        ]
+        expected = {
+            "/etc/apache2/mods-enabled/ssl.load": True,
+            "/etc/apache2/mods-enabled/ssl.conf": False,
+            "/etc/apache2/sites-enabled/000-default.conf": True,
+            "/etc/apache2/sites-available/001-default.conf": True,
+            "/etc/apache2/sites-other/000-default.conf": False,
+            "/etc/apache2/sites-enabled/0000-default.conf": False,
+            "/etc/apache2/conf.d/ports.conf": True,
+            "/etc/apache2/ports.conf": False,
+        }
+        for filepath, included in expected.items():
+            assert apache_util.included_in_paths(filepath, paths) is included
+            assert included == any(fnmatch.fnmatch(filepath, path) for path in paths)
+
+        # Changes to a reused list must be taken into account
+        paths.append("/etc/apache2/conf-enabled/*.conf")
+        assert apache_util.included_in_paths("/etc/apache2/conf-enabled/a.conf", paths)
+        paths.pop()
+        assert not apache_util.included_in_paths("/etc/apache2/conf-enabled/a.conf", paths)
+
+    def test_included_in_paths_exact(self):
+        exact = ["/etc/apache2/apache2.conf", "/etc/apache2/ports.conf"]
+        wildcard = ["/etc/apache2/sites-enabled/*.conf"]
+
+        # Only full paths
+        assert apache_util.included_in_paths("/etc/apache2/ports.conf", exact)
+        assert not apache_util.included_in_paths("/etc/apache2/other.conf", exact)
+        # Only wildcard paths
+        assert apache_util.included_in_paths("/etc/apache2/sites-enabled/a.conf", wildcard)
+        assert not apache_util.included_in_paths("/etc/apache2/ports.conf", wildcard)
+        # Full and wildcard paths
+        mixed = exact + wildcard
+        assert apache_util.included_in_paths("/etc/apache2/apache2.conf", mixed)
+        assert apache_util.included_in_paths("/etc/apache2/sites-enabled/a.conf", mixed)
+        assert not apache_util.included_in_paths("/etc/apache2/sites-enabled/a.load", mixed)
+        # No paths
+        assert not apache_util.included_in_paths("/etc/apache2/apache2.conf", [])
+
+        # A path without wildcards only matches itself, as with fnmatch
+        for filepath in ["/etc/apache2/apache2.conf", "/etc/apache2/apache2.con",
+                         "/etc/apache2/apache2.conf/", "/etc/apache2/Apache2.conf",
+                         "/etc/apache2/apache2.conf.bak", "etc/apache2/apache2.conf"]:
+            assert apache_util.included_in_paths(filepath, exact) == \
+                any(fnmatch.fnmatchcase(filepath, path) for path in exact)
+
     def test_bad_servername_alias(self):
         ssl_vh1 = obj.VirtualHost(
             "fp1", "ap1", {obj.Addr(("*", "443"))},
@@ -114,10 +114,9 @@ class MultipleVhostsTestFedora(util.ApacheTest):
         )
         def mock_get_cfg(command):
             """Mock httpd process stdout"""
-            if command == ['httpd', '-t', '-D', 'DUMP_RUN_CFG']:
-                return define_val
-            elif command == ['httpd', '-t', '-D', 'DUMP_MODULES']:
-                return mod_val
+            if command == ['httpd', '-t', '-D', 'DUMP_RUN_CFG',
+                           '-D', 'DUMP_INCLUDES', '-D', 'DUMP_MODULES']:
+                return define_val + mod_val
             return ""
         mock_get.side_effect = mock_get_cfg
         self.config.parser.modules = {}
@@ -128,7 +127,7 @@ class MultipleVhostsTestFedora(util.ApacheTest):
             mock_osi.return_value = ("fedora", "29")
             self.config.parser.update_runtime_variables()
 
-        assert mock_get.call_count == 3
+        assert mock_get.call_count == 1
         assert len(self.config.parser.modules) == 4
         assert len(self.config.parser.variables) == 2
         assert "TEST2" in self.config.parser.variables
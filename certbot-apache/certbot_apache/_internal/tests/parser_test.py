@@ -198,6 +198,8 @@ class BasicParserTest(util.ParserTest):
             'PidFile: "/var/run/apache2/apache2.pid"\n'
             'Define: TEST\n'
             'Define: DUMP_RUN_CFG\n'
+            'Define: DUMP_INCLUDES\n'
+            'Define: DUMP_MODULES\n'
             'Define: U_MICH\n'
             'Define: TLS=443\n'
             'Define: WITH_ASSIGNMENT=URL=http://example.com\n'
@@ -269,13 +271,14 @@ class BasicParserTest(util.ParserTest):
 
         def mock_get_vars(cmd):
             """Mock command output"""
-            if cmd[-1] == "DUMP_RUN_CFG":
-                return define_val
-            elif cmd[-1] == "DUMP_INCLUDES":
-                return inc_val
-            elif cmd[-1] == "DUMP_MODULES":
-                return mod_val
-            return None  # pragma: no cover
+            stdout = ""
+            if "DUMP_RUN_CFG" in cmd:
+                stdout += define_val
+            if "DUMP_INCLUDES" in cmd:
+                stdout += inc_val
+            if "DUMP_MODULES" in cmd:
+                stdout += mod_val
+            return stdout
 
         mock_cfg.side_effect = mock_get_vars
 
@@ -289,12 +292,65 @@ class BasicParserTest(util.ParserTest):
         with mock.patch(
             "certbot_apache._internal.parser.ApacheParser.parse_file") as mock_parse:
             self.parser.update_runtime_variables()
+            # All the dumps should have been requested from a single process
+            assert mock_cfg.call_count == 1
             assert self.parser.variables == expected_vars
             assert len(self.parser.modules) == 58
             # None of the includes in inc_val should be in parsed paths.
             # Make sure we tried to include them all.
             assert mock_parse.call_count == 25
 
+    @mock.patch("certbot_apache._internal.apache_util._get_runtime_cfg")
+    def test_parse_includes_and_modules(self, mock_cfg):
+        from certbot_apache._internal.apache_util import parse_includes
+        from certbot_apache._internal.apache_util import parse_modules
+        mock_cfg.return_value = (
+            'Included configuration files:\n'
+            '  (*) /etc/apache2/apache2.conf\n'
+            '    (12) /etc/apache2/sites-enabled/odd (1) name.conf\n'
+            'Loaded Modules:\n'
+            ' core_module (static)\n'
+            ' mpm_event_module (shared)\n'
+        )
+
+        assert parse_includes(["apache2ctl", "-t", "-D", "DUMP_INCLUDES"]) == [
+            "/etc/apache2/apache2.conf",
+            "/etc/apache2/sites-enabled/odd (1) name.conf",
+        ]
+        assert parse_modules(["apache2ctl", "-t", "-D", "DUMP_MODULES"]) == [
+            "core", "mpm_event",
+        ]
+
+    @mock.patch("certbot_apache._internal.parser.ApacheParser.find_dir")
+    @mock.patch("certbot_apache._internal.apache_util._get_runtime_cfg")
+    def test_update_runtime_variables_no_dump_define(self, mock_cfg, _):
+        # DUMP_RUN_CFG only appears as part of a longer Define
+        mock_cfg.return_value = (
+            'Define: DUMP_RUN_CFG_EXTRA\n'
+            'Define: TEST\n'
+        )
+        self.parser.variables = {"OLD": ""}
+
+        self.parser.update_runtime_variables()
+        assert self.parser.variables == {}
+
+    @mock.patch("certbot_apache._internal.parser.ApacheParser.find_dir")
+    @mock.patch("certbot_apache._internal.apache_util._get_runtime_cfg")
+    def test_update_runtime_variables_separate_cmds(self, mock_cfg, _):
+        mock_cfg.return_value = (
+            'Loaded Modules:\n'
+            ' core_module (static)\n'
+        )
+        self.config.options.get_modules_cmd = ["apache2ctl", "modules"]
+        self.parser.modules = {}
+
+        self.parser.update_runtime_variables()
+        # The modules command can't be combined with the other dumps
+        assert mock_cfg.call_count == 3
+        assert mock_cfg.call_args_list[-1] == mock.call(["apache2ctl", "modules"])
+        assert self.parser.variables == {}
+        assert "core_module" in self.parser.modules
+
     @mock.patch("certbot_apache._internal.parser.ApacheParser.find_dir")
     @mock.patch("certbot_apache._internal.apache_util._get_runtime_cfg")
     def test_update_runtime_variables_alt_values(self, mock_cfg, _):
@@ -1,4 +1,5 @@
 """Tests for certbot.crypto_util."""
+import hashlib
 import logging
 import re
 import sys
@@ -421,13 +422,24 @@ class NotAfterTest(unittest.TestCase):
                          '2014-12-18T22:34:45+00:00'
 
 
-class Sha256sumTest(unittest.TestCase):
-    """Tests for certbot.crypto_util.notAfter"""
+class Sha256sumTest(test_util.TempDirTestCase):
+    """Tests for certbot.crypto_util.sha256sum"""
     def test_sha256sum(self):
         from certbot.crypto_util import sha256sum
         assert sha256sum(CERT_PATH) == \
             '914ffed8daf9e2c99d90ac95c77d54f32cbd556672facac380f0c063498df84e'
 
+    @mock.patch("certbot.crypto_util._SHA256SUM_CHUNK_SIZE", 3)
+    def test_sha256sum_chunks(self):
+        from certbot.crypto_util import sha256sum
+        path = os.path.join(self.tempdir, "file")
+        # Newlines and multi-byte characters straddle chunk boundaries
+        with open(path, "wb") as f:
+            f.write("ab\r\ncd\u00e9\r\n\r\nx\u20acyz\r".encode("UTF-8"))
+        with open(path, "r") as f:
+            expected = hashlib.sha256(f.read().encode("UTF-8")).hexdigest()
+        assert sha256sum(path) == expected
+
 
 class CertAndChainFromFullchainTest(unittest.TestCase):
     """Tests for certbot.crypto_util.cert_and_chain_from_fullchain"""
@@ -547,6 +547,10 @@ def _notAfterBefore(cert_path: str,
     return pyrfc3339.parse(timestamp_str)
 
 
+# Number of characters read at once by sha256sum.
+_SHA256SUM_CHUNK_SIZE = 1024 * 1024
+
+
 def sha256sum(filename: str) -> str:
     """Compute a sha256sum of a file.
 
@@ -560,7 +564,10 @@ def sha256sum(filename: str) -> str:
     """
     sha256 = hashlib.sha256()
     with open(filename, 'r') as file_d:
-        sha256.update(file_d.read().encode('UTF-8'))
+        # Hash the file in fixed-size chunks to keep memory usage constant
+        # regardless of the file size.
+        for chunk in iter(lambda: file_d.read(_SHA256SUM_CHUNK_SIZE), ''):
+            sha256.update(chunk.encode('UTF-8'))
     return sha256.hexdigest()
 
 # Finds one CERTIFICATE stricttextualmsg according to rfc7468#section-3.